@@ -4,8 +4,13 @@ import json
 import time
 from datetime import datetime
 import pandas as pd
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import os
+import functools
+import itertools
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 
 # Configure page
 st.set_page_config(
@@ -16,8 +21,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better UI
-st.markdown("""
-<style>
+_CSS = """
     .main-header {
         font-size: 2.5rem;
         font-weight: 700;
@@ -53,43 +57,186 @@ st.markdown("""
         border-radius: 5px;
         font-weight: bold;
     }
-</style>
-""", unsafe_allow_html=True)
+"""
+
+_STYLE_TAG = f"<style>{_CSS}</style>"
+
+# Lookup tables used while rendering
+_STATUS_CLASS = {
+    'Completed': 'status-success',
+    'Pending': 'status-pending',
+    'Running': 'status-pending',
+    'Failed': 'status-failed'
+}
+_STATUS_LABELS = {
+    'Completed': '✅ Completed',
+    'Pending': '⏳ Pending',
+    'Running': '🔄 Running',
+    'Failed': '❌ Failed'
+}
+_TASK_TABLE_COLUMNS = {
+    'id': st.column_config.NumberColumn("Task", format="#%d", width="small"),
+    'status': st.column_config.TextColumn("Status", width="small"),
+    'description': st.column_config.TextColumn("Description", width="large"),
+    'task_type': st.column_config.TextColumn("Type"),
+    'priority': st.column_config.TextColumn("Priority", width="small"),
+    'timestamp': st.column_config.DatetimeColumn("Created", format="YYYY-MM-DD HH:mm:ss"),
+    'result': st.column_config.TextColumn("Result")
+}
+_TASK_TYPE_LABELS = {
+    "form_fill": "📝 Form Filling",
+    "data_extraction": "📊 Data Extraction",
+    "click_automation": "🖱️ Click Automation",
+    "file_upload": "📁 File Upload"
+}
+
+def _inject_css():
+    """Inject the custom CSS without going through the markdown pipeline"""
+    st.html(_STYLE_TAG)
+
+@st.cache_resource(show_spinner=False)
+def _get_executor() -> ThreadPoolExecutor:
+    """Worker pool shared by all sessions for running automation tasks"""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="automation")
+
+_TASK_STATUSES = pd.CategoricalDtype(['Pending', 'Running', 'Completed', 'Failed'])
+_TASK_PRIORITIES = pd.CategoricalDtype(['Low', 'Medium', 'High'], ordered=True)
+
+def _build_tasks_frame(tasks: List[Dict]) -> pd.DataFrame:
+    """Build a columnar view of the tasks with compact, fixed dtypes"""
+    df = pd.DataFrame(tasks, columns=None if tasks else ['id', 'timestamp', 'status', 'priority'])
+    return df.astype({
+        'id': 'int32',
+        'status': _TASK_STATUSES,
+        'priority': _TASK_PRIORITIES,
+    }).assign(timestamp=pd.to_datetime(df['timestamp']))
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _tasks_to_csv(fingerprint: tuple, _tasks_df: pd.DataFrame) -> bytes:
+    """Serialize tasks to CSV; rebuilt only when the fingerprint changes"""
+    return _tasks_df.to_csv(index=False).encode()
 
 class WebAutomationManager:
+    """Per-session task store backed by ``st.session_state``.
+    
+    Mutations (``add_task``, ``update_task_status``, ``clear_all``,
+    ``execute_web_task`` and ``collect_finished_tasks``) hold the session's
+    ``tasks_lock`` and are safe to call from several script threads of one
+    session at once. Reads return
+    snapshots and need no lock. Background workers never touch session state;
+    their results are applied by ``collect_finished_tasks`` on a script thread.
+    """
+    
     def __init__(self):
         if 'tasks' not in st.session_state:
             st.session_state.tasks = []
-        if 'task_counter' not in st.session_state:
-            st.session_state.task_counter = 1
+        if 'tasks_by_id' not in st.session_state:
+            st.session_state.tasks_by_id = {
+                task['id']: task for task in st.session_state.tasks
+            }
+        if 'task_ids' not in st.session_state:
+            st.session_state.task_ids = itertools.count(1)
+        if 'tasks_lock' not in st.session_state:
+            st.session_state.tasks_lock = threading.RLock()
+        if 'futures' not in st.session_state:
+            st.session_state.futures = {}
+        if 'task_notices' not in st.session_state:
+            st.session_state.task_notices = []
+        if 'tasks_revision' not in st.session_state:
+            st.session_state.tasks_revision = 0
+        if 'session_key' not in st.session_state:
+            st.session_state.session_key = uuid.uuid4().hex
+        if 'tasks_df' not in st.session_state:
+            st.session_state.tasks_df = (None, None)
+        if 'selected_task_id' not in st.session_state:
+            st.session_state.selected_task_id = None
     
     def add_task(self, task_data: Dict[str, Any]):
         """Add a new automation task"""
-        task = {
-            'id': st.session_state.task_counter,
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'status': 'Pending',
-            **task_data
-        }
-        st.session_state.tasks.append(task)
-        st.session_state.task_counter += 1
+        with st.session_state.tasks_lock:
+            task = {
+                'id': next(st.session_state.task_ids),
+                'timestamp': datetime.now().isoformat(sep=' ', timespec='seconds'),
+                'status': 'Pending',
+                **task_data
+            }
+            st.session_state.tasks.append(task)
+            st.session_state.tasks_by_id[task['id']] = task
+            st.session_state.tasks_revision += 1
         return task['id']
     
     def update_task_status(self, task_id: int, status: str, result: str = None):
         """Update task status"""
-        for task in st.session_state.tasks:
-            if task['id'] == task_id:
+        with st.session_state.tasks_lock:
+            task = st.session_state.tasks_by_id.get(task_id)
+            if task:
                 task['status'] = status
                 if result:
                     task['result'] = result
-                task['updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                break
+                task['updated'] = datetime.now().isoformat(sep=' ', timespec='seconds')
+                st.session_state.tasks_revision += 1
+    
+    def clear_all(self):
+        """Remove all tasks and reset the task counter"""
+        with st.session_state.tasks_lock:
+            st.session_state.tasks = []
+            st.session_state.tasks_by_id = {}
+            st.session_state.futures = {}
+            st.session_state.task_ids = itertools.count(1)
+            st.session_state.selected_task_id = None
+            st.session_state.tasks_revision += 1
+    
+    def get_tasks_df(self) -> pd.DataFrame:
+        """Get all tasks newest first as a DataFrame, rebuilt only after changes"""
+        revision, df = st.session_state.tasks_df
+        if revision != st.session_state.tasks_revision:
+            df = _build_tasks_frame(self.get_tasks())
+            st.session_state.tasks_df = (st.session_state.tasks_revision, df)
+        return df
+    
+    def get_status_counts(self) -> pd.Series:
+        """Number of tasks in each status, including statuses with no tasks"""
+        return self.get_tasks_df()['status'].value_counts()
     
-    def get_tasks(self) -> List[Dict]:
-        """Get all tasks"""
-        return st.session_state.tasks[::-1]  # Return newest first
+    def export_csv(self) -> bytes:
+        """Get all tasks as CSV, reusing the cached export while tasks are unchanged"""
+        fingerprint = (st.session_state.session_key, st.session_state.tasks_revision)
+        return _tasks_to_csv(fingerprint, self.get_tasks_df())
     
-    def execute_web_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
+    def get_tasks(self, limit: Optional[int] = None) -> List[Dict]:
+        """Get tasks newest first, at most ``limit`` of them"""
+        return list(itertools.islice(reversed(st.session_state.tasks), limit))
+    
+    def task_count(self) -> int:
+        """Get the number of tasks"""
+        return len(st.session_state.tasks)
+    
+    def execute_web_task(self, task_id: int, task_data: Dict[str, Any]) -> Future:
+        """Start a web automation task in the background worker pool"""
+        with st.session_state.tasks_lock:
+            future = _get_executor().submit(self._dispatch, dict(task_data))
+            st.session_state.futures[task_id] = future
+            self.update_task_status(task_id, "Running")
+        return future
+    
+    def collect_finished_tasks(self) -> int:
+        """Record results of finished background tasks, return how many finished"""
+        with st.session_state.tasks_lock:
+            finished = [
+                task_id for task_id, future in st.session_state.futures.items()
+                if future.done()
+            ]
+            for task_id in finished:
+                result = st.session_state.futures.pop(task_id).result()
+                if result['success']:
+                    self.update_task_status(task_id, "Completed", result['message'])
+                    st.session_state.task_notices.append(f"✅ Task #{task_id} completed: {result['message']}")
+                else:
+                    self.update_task_status(task_id, "Failed", result['error'])
+                    st.session_state.task_notices.append(f"❌ Task #{task_id} failed: {result['error']}")
+        return len(finished)
+    
+    def _dispatch(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute web automation task"""
         try:
             # Simulate web automation (replace with actual implementation)
@@ -154,10 +301,136 @@ class WebAutomationManager:
             'uploaded_files': files
         }
 
+def _remember_selected_task(table_key: str, task_ids: List[int]):
+    """Record the id of the row picked in the recent tasks table"""
+    rows = st.session_state[table_key].selection.rows
+    st.session_state.selected_task_id = task_ids[rows[0]] if rows else None
+
+@st.fragment
+def _render_dashboard(automation_manager: WebAutomationManager):
+    """Task dashboard; reruns on its own so sidebar edits don't redraw it"""
+    st.header("📊 Task Dashboard")
+    
+    # Task statistics
+    total_tasks = automation_manager.task_count()
+    if total_tasks:
+        status_counts = automation_manager.get_status_counts()
+        
+        col_stat1, col_stat2, col_stat3, col_stat4 = st.columns(4)
+        col_stat1.metric("Total Tasks", total_tasks)
+        col_stat2.metric("Completed", int(status_counts['Completed']))
+        col_stat3.metric("Pending", int(status_counts['Pending']))
+        col_stat4.metric("Failed", int(status_counts['Failed']))
+    
+    # Task list
+    if total_tasks:
+        st.subheader("Recent Tasks")
+        recent = automation_manager.get_tasks_df().head(10)  # Show latest 10 tasks
+        view = recent.reindex(columns=list(_TASK_TABLE_COLUMNS)).assign(
+            status=recent['status'].map(_STATUS_LABELS)
+        )
+        # Table selections are row positions, so remember the picked task by
+        # id and key the table on the rows it shows: when a new task shifts
+        # the rows, the stale highlight is dropped instead of moving to
+        # another task
+        task_ids = [int(task_id) for task_id in recent['id']]
+        table_key = f"recent_tasks_{task_ids[0]}_{len(task_ids)}"
+        st.dataframe(
+            view,
+            hide_index=True,
+            column_config=_TASK_TABLE_COLUMNS,
+            key=table_key,
+            on_select=functools.partial(_remember_selected_task, table_key, task_ids),
+            selection_mode="single-row"
+        )
+        
+        # Details and actions only for the task picked in the table
+        task = st.session_state.tasks_by_id.get(st.session_state.selected_task_id)
+        if task:
+            status_class = _STATUS_CLASS.get(task['status'], 'status-pending')
+            
+            with st.expander(f"Task #{task['id']} - {task['description'][:50]}...", expanded=True):
+                col_task1, col_task2 = st.columns([3, 1])
+                
+                with col_task1:
+                    st.write(f"**Description:** {task['description']}")
+                    st.write(f"**URL:** {task['url']}")
+                    st.write(f"**Type:** {task['task_type']}")
+                    st.write(f"**Priority:** {task['priority']}")
+                    st.write(f"**Created:** {task['timestamp']}")
+                    if 'result' in task:
+                        st.write(f"**Result:** {task['result']}")
+                
+                with col_task2:
+                    st.markdown(f'<span class="{status_class}">{task["status"]}</span>', unsafe_allow_html=True)
+                    
+                    if task['status'] == 'Pending':
+                        if st.button(f"Execute #{task['id']}", key=f"exec_{task['id']}"):
+                            automation_manager.execute_web_task(task['id'], task)
+                            # Full rerun so main() starts the result poller
+                            st.rerun()
+        else:
+            st.caption("Select a task to see its details.")
+    else:
+        st.info("No tasks created yet. Use the sidebar to create your first automation task!")
+
+@st.fragment
+def _render_system_status(automation_manager: WebAutomationManager):
+    """System status panel and quick actions"""
+    st.header("⚙️ System Status")
+    
+    # System info
+    st.metric("System Status", "🟢 Online")
+    st.metric("Active Sessions", "1")
+    st.metric("Uptime", "24h 15m")
+    
+    # Quick actions
+    st.subheader("🔧 Quick Actions")
+    
+    if st.button("🗑️ Clear All Tasks"):
+        automation_manager.clear_all()
+        st.success("All tasks cleared!")
+        st.rerun()
+    
+    if st.button("📥 Export Tasks"):
+        if automation_manager.task_count():
+            st.download_button(
+                label="Download CSV",
+                data=automation_manager.export_csv(),
+                file_name=f"automation_tasks_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                mime="text/csv"
+            )
+        else:
+            st.info("No tasks to export")
+    
+    # GitHub integration status
+    st.subheader("🔗 GitHub Integration")
+    st.success("✅ Connected to repository")
+    st.code("unnikrishnan077/streamlit-web-automation")
+    
+    if st.button("🔄 Sync Repository"):
+        st.success("Repository synced successfully!")
+
+@st.fragment(run_every="0.5s")
+def _poll_running_tasks(automation_manager: WebAutomationManager):
+    """Pick up background task results and refresh the page when any finish.
+    
+    Only called while tasks are running; once a full rerun skips it, Streamlit
+    stops scheduling it.
+    """
+    if st.session_state.futures and automation_manager.collect_finished_tasks():
+        st.rerun()
+
 def main():
+    _inject_css()
+    
     # Initialize automation manager
     automation_manager = WebAutomationManager()
     
+    # Report tasks that finished in the background since the last run
+    while st.session_state.task_notices:
+        st.toast(st.session_state.task_notices.pop(0))
+    
     # Header
     st.markdown('<div class="main-header">🤖 Web Automation Control Center</div>', unsafe_allow_html=True)
     
@@ -167,13 +440,8 @@ def main():
         
         task_type = st.selectbox(
             "Task Type",
-            ["form_fill", "data_extraction", "click_automation", "file_upload"],
-            format_func=lambda x: {
-                "form_fill": "📝 Form Filling",
-                "data_extraction": "📊 Data Extraction",
-                "click_automation": "🖱️ Click Automation",
-                "file_upload": "📁 File Upload"
-            }[x]
+            list(_TASK_TYPE_LABELS),
+            format_func=_TASK_TYPE_LABELS.__getitem__
         )
         
         url = st.text_input("Target URL", placeholder="https://example.com")
@@ -227,12 +495,12 @@ def main():
                 }
                 
                 # Add task-specific data
+                error = None
                 if task_type == "form_fill" and form_fields:
                     try:
                         task_data['form_data'] = json.loads(form_fields)
                     except json.JSONDecodeError:
-                        st.error("Invalid JSON format for form fields")
-                        return
+                        error = "Invalid JSON format for form fields"
                 
                 elif task_type == "data_extraction" and selectors:
                     task_data['selectors'] = [s.strip() for s in selectors.split('\n') if s.strip()]
@@ -247,20 +515,17 @@ def main():
                 if schedule_type == "Scheduled":
                     task_data['schedule_time'] = str(schedule_time)
                 
-                # Add task
-                task_id = automation_manager.add_task(task_data)
-                st.success(f"✅ Task #{task_id} created successfully!")
-                
-                # Execute immediately if not scheduled
-                if schedule_type == "Immediate":
-                    with st.spinner("Executing task..."):
-                        result = automation_manager.execute_web_task(task_data)
-                        if result['success']:
-                            automation_manager.update_task_status(task_id, "Completed", result['message'])
-                            st.success(f"Task completed: {result['message']}")
-                        else:
-                            automation_manager.update_task_status(task_id, "Failed", result['error'])
-                            st.error(f"Task failed: {result['error']}")
+                if error:
+                    st.error(error)
+                else:
+                    # Add task, execute immediately if not scheduled, and
+                    # report the whole lifecycle with a single toast
+                    task_id = automation_manager.add_task(task_data)
+                    message = f"✅ Task #{task_id} created"
+                    if schedule_type == "Immediate":
+                        automation_manager.execute_web_task(task_id, task_data)
+                        message += " and running in the background"
+                    st.toast(message)
             else:
                 st.error("Please fill in URL and description")
     
@@ -268,96 +533,13 @@ def main():
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        st.header("📊 Task Dashboard")
-        
-        # Task statistics
-        tasks = automation_manager.get_tasks()
-        if tasks:
-            completed_tasks = len([t for t in tasks if t['status'] == 'Completed'])
-            pending_tasks = len([t for t in tasks if t['status'] == 'Pending'])
-            failed_tasks = len([t for t in tasks if t['status'] == 'Failed'])
-            
-            col_stat1, col_stat2, col_stat3, col_stat4 = st.columns(4)
-            col_stat1.metric("Total Tasks", len(tasks))
-            col_stat2.metric("Completed", completed_tasks)
-            col_stat3.metric("Pending", pending_tasks)
-            col_stat4.metric("Failed", failed_tasks)
-        
-        # Task list
-        if tasks:
-            st.subheader("Recent Tasks")
-            for task in tasks[:10]:  # Show latest 10 tasks
-                status_class = {
-                    'Completed': 'status-success',
-                    'Pending': 'status-pending',
-                    'Failed': 'status-failed'
-                }.get(task['status'], 'status-pending')
-                
-                with st.expander(f"Task #{task['id']} - {task['description'][:50]}..."):
-                    col_task1, col_task2 = st.columns([3, 1])
-                    
-                    with col_task1:
-                        st.write(f"**Description:** {task['description']}")
-                        st.write(f"**URL:** {task['url']}")
-                        st.write(f"**Type:** {task['task_type']}")
-                        st.write(f"**Priority:** {task['priority']}")
-                        st.write(f"**Created:** {task['timestamp']}")
-                        if 'result' in task:
-                            st.write(f"**Result:** {task['result']}")
-                    
-                    with col_task2:
-                        st.markdown(f'<span class="{status_class}">{task["status"]}</span>', unsafe_allow_html=True)
-                        
-                        if task['status'] == 'Pending':
-                            if st.button(f"Execute #{task['id']}", key=f"exec_{task['id']}"):
-                                with st.spinner("Executing..."):
-                                    result = automation_manager.execute_web_task(task)
-                                    if result['success']:
-                                        automation_manager.update_task_status(task['id'], "Completed", result['message'])
-                                        st.rerun()
-                                    else:
-                                        automation_manager.update_task_status(task['id'], "Failed", result['error'])
-                                        st.rerun()
-        else:
-            st.info("No tasks created yet. Use the sidebar to create your first automation task!")
+        _render_dashboard(automation_manager)
     
     with col2:
-        st.header("⚙️ System Status")
-        
-        # System info
-        st.metric("System Status", "🟢 Online")
-        st.metric("Active Sessions", "1")
-        st.metric("Uptime", "24h 15m")
-        
-        # Quick actions
-        st.subheader("🔧 Quick Actions")
-        
-        if st.button("🗑️ Clear All Tasks"):
-            st.session_state.tasks = []
-            st.session_state.task_counter = 1
-            st.success("All tasks cleared!")
-            st.rerun()
-        
-        if st.button("📥 Export Tasks"):
-            if tasks:
-                df = pd.DataFrame(tasks)
-                csv = df.to_csv(index=False)
-                st.download_button(
-                    label="Download CSV",
-                    data=csv,
-                    file_name=f"automation_tasks_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
-                )
-            else:
-                st.info("No tasks to export")
-        
-        # GitHub integration status
-        st.subheader("🔗 GitHub Integration")
-        st.success("✅ Connected to repository")
-        st.code("unnikrishnan077/streamlit-web-automation")
-        
-        if st.button("🔄 Sync Repository"):
-            st.success("Repository synced successfully!")
+        _render_system_status(automation_manager)
+    
+    if st.session_state.futures:
+        _poll_running_tasks(automation_manager)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,17 +1,43 @@
+import atexit
+import heapq
+import itertools
 import json
 import sqlite3
 import threading
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional, Iterable, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
+import queue
+
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to the stdlib
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+if orjson:
+    def _json_dumps(value: Any) -> str:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    _json_loads = orjson.loads
+else:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+def _parse_dt(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO timestamp column, keeping NULL as None"""
+    return datetime.fromisoformat(value) if value else None
+
+def _parse_json(value: Optional[str]) -> Any:
+    """Parse a JSON column, keeping NULL as None"""
+    return _json_loads(value) if value else None
+
 class TaskStatus(Enum):
     PENDING = "pending"
     RUNNING = "running"
@@ -26,7 +52,7 @@ class TaskPriority(Enum):
     HIGH = 3
     URGENT = 4
 
-@dataclass
+@dataclass(slots=True)
 class AutomationTask:
     """Data class for automation tasks"""
     id: str
@@ -48,16 +74,74 @@ class AutomationTask:
     tags: Optional[List[str]] = None
     webhook_url: Optional[str] = None
 
+# SQL text is kept constant so sqlite3's per-connection statement cache
+# reuses the prepared statements instead of re-parsing them on every call
+_SQL_INSERT_TASK = """
+    INSERT OR REPLACE INTO tasks (
+        id, task_type, url, description, priority, status,
+        created_at, updated_at, scheduled_at, executed_at, completed_at,
+        result, error_message, retry_count, max_retries,
+        task_data, tags, webhook_url
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_SELECT_TASK = "SELECT * FROM tasks WHERE id = ?"
+_SQL_SELECT_SCHEDULE = "SELECT id, scheduled_at FROM tasks WHERE status = ? AND scheduled_at IS NOT NULL"
+_SQL_INSERT_LOG = "INSERT INTO task_logs (task_id, timestamp, level, message) VALUES (?, ?, ?, ?)"
+_SQL_SELECT_TASKS_WITH_LAST_LOG = """
+    SELECT t.*, (
+        SELECT l.message FROM task_logs l
+        WHERE l.task_id = t.id
+        ORDER BY l.timestamp DESC, l.id DESC LIMIT 1
+    ) AS last_log
+    FROM tasks t
+    ORDER BY t.created_at DESC, t.id DESC LIMIT ?
+"""
+
+# Log events are buffered and written by a background thread in batches
+_LOG_QUEUE_SIZE = 1000
+_LOG_BATCH_SIZE = 200
+
 class TaskDatabase:
-    """Database handler for automation tasks"""
+    """Database handler for automation tasks.
+    
+    All methods are safe to call from any thread: they share one connection
+    and serialize access to it with an ``RLock``.
+    """
     
     def __init__(self, db_path: str = "automation_tasks.db"):
         self.db_path = db_path
+        # Long-lived connection shared by all callers; transactions are
+        # managed explicitly, so the driver runs in autocommit mode.
+        self._conn = sqlite3.connect(
+            db_path, check_same_thread=False, isolation_level=None, cached_statements=256
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
         self.init_database()
+        
+        # Holds log rows, threading.Event flush markers and a final None
+        self._log_queue: "queue.Queue[Any]" = queue.Queue(_LOG_QUEUE_SIZE)
+        self._log_closed = False
+        self._log_close_lock = threading.Lock()
+        self._log_writer = threading.Thread(
+            target=self._log_writer_loop, name="task-log-writer", daemon=True
+        )
+        self._log_writer.start()
+        # The writer is a daemon thread, so drain the queue before exit
+        atexit.register(self.close)
     
     def init_database(self):
         """Initialize the database with required tables"""
-        with sqlite3.connect(self.db_path) as conn:
+        conn = self._conn
+        with self._lock:
+            # WAL lets readers run alongside the writer and needs a single
+            # fsync per commit when combined with synchronous=NORMAL.
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA cache_size=-20000")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS tasks (
                     id TEXT PRIMARY KEY,
@@ -91,59 +175,117 @@ class TaskDatabase:
                     FOREIGN KEY (task_id) REFERENCES tasks (id)
                 )
             """)
+            
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tasks_status_created ON tasks (status, created_at DESC, id DESC)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tasks_created ON tasks (created_at DESC, id DESC)"
+            )
+            # (task_id, timestamp) serves plain task_id lookups as well as the
+            # latest-log-per-task subquery
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_logs_task_ts ON task_logs (task_id, timestamp DESC)"
+            )
     
     def save_task(self, task: AutomationTask):
         """Save or update a task in the database"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO tasks (
-                    id, task_type, url, description, priority, status,
-                    created_at, updated_at, scheduled_at, executed_at, completed_at,
-                    result, error_message, retry_count, max_retries,
-                    task_data, tags, webhook_url
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                task.id, task.task_type, task.url, task.description,
-                task.priority.value, task.status.value,
-                task.created_at.isoformat(), task.updated_at.isoformat(),
-                task.scheduled_at.isoformat() if task.scheduled_at else None,
-                task.executed_at.isoformat() if task.executed_at else None,
-                task.completed_at.isoformat() if task.completed_at else None,
-                json.dumps(task.result) if task.result else None,
-                task.error_message, task.retry_count, task.max_retries,
-                json.dumps(task.task_data) if task.task_data else None,
-                json.dumps(task.tags) if task.tags else None,
-                task.webhook_url
-            ))
+        self.save_tasks([task])
+    
+    def save_tasks(self, tasks: Iterable[AutomationTask]):
+        """Save or update several tasks in a single transaction"""
+        rows = [self._task_to_row(task) for task in tasks]
+        if not rows:
+            return
+        
+        self._executemany(_SQL_INSERT_TASK, rows)
+    
+    def _executemany(self, sql: str, rows: List[Tuple]):
+        """Run ``sql`` for every row inside a single transaction"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(sql, rows)
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+    
+    def _task_to_row(self, task: AutomationTask) -> Tuple:
+        """Convert AutomationTask object to database row parameters"""
+        return (
+            task.id, task.task_type, task.url, task.description,
+            task.priority.value, task.status.value,
+            task.created_at.isoformat(), task.updated_at.isoformat(),
+            task.scheduled_at.isoformat() if task.scheduled_at else None,
+            task.executed_at.isoformat() if task.executed_at else None,
+            task.completed_at.isoformat() if task.completed_at else None,
+            _json_dumps(task.result) if task.result else None,
+            task.error_message, task.retry_count, task.max_retries,
+            _json_dumps(task.task_data) if task.task_data else None,
+            _json_dumps(task.tags) if task.tags else None,
+            task.webhook_url
+        )
     
     def get_task(self, task_id: str) -> Optional[AutomationTask]:
         """Retrieve a task by ID"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("SELECT * FROM tasks WHERE id = ?", (task_id,))
-            row = cursor.fetchone()
-            
-            if row:
-                return self._row_to_task(row)
-            return None
+        with self._lock:
+            row = self._conn.execute(_SQL_SELECT_TASK, (task_id,)).fetchone()
+        
+        if row:
+            return self._row_to_task(row)
+        return None
     
-    def get_tasks(self, status: Optional[TaskStatus] = None, limit: int = 100) -> List[AutomationTask]:
-        """Retrieve tasks, optionally filtered by status"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            
-            if status:
-                cursor = conn.execute(
-                    "SELECT * FROM tasks WHERE status = ? ORDER BY created_at DESC LIMIT ?",
-                    (status.value, limit)
-                )
-            else:
-                cursor = conn.execute(
-                    "SELECT * FROM tasks ORDER BY created_at DESC LIMIT ?",
-                    (limit,)
-                )
-            
-            return [self._row_to_task(row) for row in cursor.fetchall()]
+    def get_tasks(
+        self,
+        status: Optional[TaskStatus] = None,
+        limit: int = 100,
+        before: Optional[Tuple[datetime, str]] = None
+    ) -> List[AutomationTask]:
+        """Retrieve tasks newest first, optionally filtered by status.
+        
+        Pass the ``(created_at, id)`` of the last task of a page as ``before``
+        to fetch the next page; this seeks through the created_at index
+        instead of scanning and sorting the whole table. The id breaks ties
+        between tasks created at the same instant.
+        """
+        clauses = []
+        params: List[Any] = []
+        if status:
+            clauses.append("status = ?")
+            params.append(status.value)
+        if before:
+            # Same as created_at < ? OR (created_at = ? AND id < ?), but the
+            # row value lets SQLite seek the index without a separate sort
+            before_created, before_id = before
+            clauses.append("(created_at, id) < (?, ?)")
+            params.extend((before_created.isoformat(), before_id))
+        
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        params.append(limit)
+        
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM tasks {where}ORDER BY created_at DESC, id DESC LIMIT ?",
+                params
+            ).fetchall()
+        
+        return [self._row_to_task(row) for row in rows]
+    
+    def get_tasks_with_last_log(self, limit: int = 100) -> List[Tuple[AutomationTask, Optional[str]]]:
+        """Retrieve the newest tasks paired with their most recent log message"""
+        self.flush_logs()
+        with self._lock:
+            rows = self._conn.execute(_SQL_SELECT_TASKS_WITH_LAST_LOG, (limit,)).fetchall()
+        
+        return [(self._row_to_task(row), row['last_log']) for row in rows]
+    
+    def get_schedule(self) -> List[Tuple[datetime, str]]:
+        """Retrieve (scheduled_at, task_id) for every task still waiting to run"""
+        with self._lock:
+            rows = self._conn.execute(_SQL_SELECT_SCHEDULE, (TaskStatus.SCHEDULED.value,)).fetchall()
+        
+        return [(datetime.fromisoformat(row['scheduled_at']), row['id']) for row in rows]
     
     def _row_to_task(self, row: sqlite3.Row) -> AutomationTask:
         """Convert database row to AutomationTask object"""
@@ -156,33 +298,104 @@ class TaskDatabase:
             status=TaskStatus(row['status']),
             created_at=datetime.fromisoformat(row['created_at']),
             updated_at=datetime.fromisoformat(row['updated_at']),
-            scheduled_at=datetime.fromisoformat(row['scheduled_at']) if row['scheduled_at'] else None,
-            executed_at=datetime.fromisoformat(row['executed_at']) if row['executed_at'] else None,
-            completed_at=datetime.fromisoformat(row['completed_at']) if row['completed_at'] else None,
-            result=json.loads(row['result']) if row['result'] else None,
+            scheduled_at=_parse_dt(row['scheduled_at']),
+            executed_at=_parse_dt(row['executed_at']),
+            completed_at=_parse_dt(row['completed_at']),
+            result=_parse_json(row['result']),
             error_message=row['error_message'],
             retry_count=row['retry_count'],
             max_retries=row['max_retries'],
-            task_data=json.loads(row['task_data']) if row['task_data'] else None,
-            tags=json.loads(row['tags']) if row['tags'] else None,
+            task_data=_parse_json(row['task_data']),
+            tags=_parse_json(row['tags']),
             webhook_url=row['webhook_url']
         )
     
     def log_task_event(self, task_id: str, level: str, message: str):
-        """Log a task event"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                "INSERT INTO task_logs (task_id, timestamp, level, message) VALUES (?, ?, ?, ?)",
-                (task_id, datetime.now().isoformat(), level, message)
-            )
+        """Queue a task event for the log writer; never blocks the caller"""
+        try:
+            self._log_queue.put_nowait((task_id, datetime.now().isoformat(), level, message))
+        except queue.Full:
+            logger.warning(f"Task log queue full, dropped event for {task_id}: {message}")
+    
+    def flush_logs(self):
+        """Block until the log events queued before this call have been written.
+        
+        Events queued by other threads afterwards are not waited for. Once the
+        writer has stopped there is nothing to wait for, so this returns at once.
+        """
+        written = threading.Event()
+        with self._log_close_lock:
+            if self._log_closed:
+                return
+            self._log_queue.put(written)
+        written.wait()
+    
+    def close(self):
+        """Write pending log events, stop the log writer and close the connection"""
+        atexit.unregister(self.close)
+        with self._log_close_lock:
+            if self._log_closed:
+                return
+            self._log_closed = True
+            self._log_queue.put(None)
+        self._log_writer.join()
+        with self._lock:
+            self._conn.close()
+    
+    def _log_writer_loop(self):
+        """Write queued log events in batches until a ``None`` sentinel arrives.
+        
+        ``threading.Event`` items are flush markers, set once the rows queued
+        ahead of them have been written.
+        """
+        while True:
+            batch = [self._log_queue.get()]
+            try:
+                while len(batch) < _LOG_BATCH_SIZE:
+                    batch.append(self._log_queue.get_nowait())
+            except queue.Empty:
+                pass
+            
+            rows = [item for item in batch if isinstance(item, tuple)]
+            try:
+                if rows:
+                    self._executemany(_SQL_INSERT_LOG, rows)
+            except Exception as e:
+                logger.error(f"Failed to write {len(rows)} task log events: {str(e)}")
+            finally:
+                # Every row queued before a flush marker is in this batch or
+                # an earlier one, so its waiter can be released
+                for item in batch:
+                    if isinstance(item, threading.Event):
+                        item.set()
+            
+            if None in batch:
+                return
+
+# Disambiguates task ids created within the same millisecond
+_task_sequence = itertools.count()
 
 class TaskScheduler:
-    """Task scheduling and management system"""
+    """Task scheduling and management system.
+    
+    ``create_task`` and the query methods may be called from any thread;
+    ``start`` and ``stop`` should be called from the thread that owns the
+    scheduler.
+    """
     
     def __init__(self, db_path: str = "automation_tasks.db"):
         self.db = TaskDatabase(db_path)
         self.scheduler_thread = None
         self.running = False
+        self.on_task_due: Optional[Callable[[AutomationTask], None]] = None
+        
+        # Min-heap of (scheduled_at timestamp, task_id); the scheduler thread
+        # only touches the database when the earliest entry falls due
+        self._due_heap: List[Tuple[float, str]] = [
+            (scheduled_at.timestamp(), task_id) for scheduled_at, task_id in self.db.get_schedule()
+        ]
+        heapq.heapify(self._due_heap)
+        self._heap_changed = threading.Condition()
     
     def create_task(
         self,
@@ -197,7 +410,7 @@ class TaskScheduler:
     ) -> str:
         """Create a new automation task"""
         
-        task_id = f"task_{int(time.time() * 1000)}"
+        task_id = f"task_{int(time.time() * 1000)}_{next(_task_sequence)}"
         now = datetime.now()
         
         task = AutomationTask(
@@ -218,9 +431,72 @@ class TaskScheduler:
         self.db.save_task(task)
         self.db.log_task_event(task_id, "INFO", "Task created")
         
+        if scheduled_at:
+            with self._heap_changed:
+                heapq.heappush(self._due_heap, (scheduled_at.timestamp(), task_id))
+                self._heap_changed.notify()
+        
         logger.info(f"Created task {task_id}: {description}")
         return task_id
     
+    def start(self, on_task_due: Optional[Callable[[AutomationTask], None]] = None):
+        """Start the scheduler thread; ``on_task_due`` is called for each task that falls due"""
+        if self.running:
+            return
+        
+        self.on_task_due = on_task_due
+        self.running = True
+        self.scheduler_thread = threading.Thread(
+            target=self._scheduler_loop, name="task-scheduler", daemon=True
+        )
+        self.scheduler_thread.start()
+    
+    def stop(self):
+        """Stop the scheduler thread"""
+        with self._heap_changed:
+            self.running = False
+            self._heap_changed.notify()
+        if self.scheduler_thread:
+            self.scheduler_thread.join()
+            self.scheduler_thread = None
+    
+    def _scheduler_loop(self):
+        """Sleep until the earliest scheduled task is due, then release it"""
+        while True:
+            with self._heap_changed:
+                while self.running:
+                    timeout = self._due_heap[0][0] - time.time() if self._due_heap else None
+                    if timeout is not None and timeout <= 0:
+                        break
+                    self._heap_changed.wait(timeout)
+                if not self.running:
+                    return
+                
+                now = time.time()
+                due = []
+                while self._due_heap and self._due_heap[0][0] <= now:
+                    due.append(heapq.heappop(self._due_heap)[1])
+            
+            for task_id in due:
+                self._release_task(task_id)
+    
+    def _release_task(self, task_id: str):
+        """Move a due task from SCHEDULED to PENDING and hand it to the callback"""
+        task = self.db.get_task(task_id)
+        if not task or task.status != TaskStatus.SCHEDULED:
+            return
+        
+        task.status = TaskStatus.PENDING
+        task.updated_at = datetime.now()
+        self.db.save_task(task)
+        self.db.log_task_event(task_id, "INFO", "Scheduled time reached")
+        
+        if self.on_task_due:
+            try:
+                self.on_task_due(task)
+            except Exception as e:
+                logger.error(f"Task due callback failed for {task_id}: {str(e)}")
+    
     def get_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Get task status and details"""
         task = self.db.get_task(task_id)
@@ -240,27 +516,49 @@ class TaskScheduler:
             'retry_count': task.retry_count
         }
     
-    def get_all_tasks(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get all tasks, optionally filtered by status"""
+    def get_all_tasks(
+        self,
+        status: Optional[str] = None,
+        limit: int = 100,
+        before: Optional[str] = None,
+        before_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get tasks newest first, optionally filtered by status.
+        
+        ``before`` and ``before_id`` are the ``created_at`` and ``id`` of the
+        last task already shown; only tasks after it are returned, giving the
+        next page.
+        """
+        if before and not before_id:
+            raise ValueError("before_id is required with before")
         task_status = TaskStatus(status) if status else None
-        tasks = self.db.get_tasks(status=task_status)
+        cursor = (datetime.fromisoformat(before), before_id) if before else None
+        tasks = self.db.get_tasks(status=task_status, limit=limit, before=cursor)
         
+        return [self._task_summary(task) for task in tasks]
+    
+    def get_tasks_with_last_log(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get the newest tasks with their latest log message, in one query"""
         return [
-            {
-                'id': task.id,
-                'task_type': task.task_type,
-                'url': task.url,
-                'description': task.description,
-                'priority': task.priority.value,
-                'status': task.status.value,
-                'created_at': task.created_at.isoformat(),
-                'updated_at': task.updated_at.isoformat(),
-                'scheduled_at': task.scheduled_at.isoformat() if task.scheduled_at else None,
-                'result': task.result,
-                'error_message': task.error_message
-            }
-            for task in tasks
+            {**self._task_summary(task), 'last_log': last_log}
+            for task, last_log in self.db.get_tasks_with_last_log(limit)
         ]
+    
+    def _task_summary(self, task: AutomationTask) -> Dict[str, Any]:
+        """Convert AutomationTask object to the dict returned by listings"""
+        return {
+            'id': task.id,
+            'task_type': task.task_type,
+            'url': task.url,
+            'description': task.description,
+            'priority': task.priority.value,
+            'status': task.status.value,
+            'created_at': task.created_at.isoformat(),
+            'updated_at': task.updated_at.isoformat(),
+            'scheduled_at': task.scheduled_at.isoformat() if task.scheduled_at else None,
+            'result': task.result,
+            'error_message': task.error_message
+        }
 
 # Global task scheduler instance
 task_scheduler = TaskScheduler()
\ No newline at end of file
@@ -1,7 +1,14 @@
 import time
 import json
 import os
-from typing import Dict, List, Any, Optional
+import threading
+import atexit
+import functools
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+from typing import Callable, Deque, Dict, List, Any, Optional, Tuple
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -11,49 +18,299 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.action_chains import ActionChains
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.remote.file_detector import UselessFileDetector
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
 import requests
 from bs4 import BeautifulSoup
 
+_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Chrome flags shared by every controller; initialize_driver adds the
+# per-instance ones (headless, images) on top
+_BASE_CHROME_ARGS = (
+    # Optimization arguments
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-logging',
+    '--silent',
+    f'--user-agent={_USER_AGENT}',
+    # Performance settings
+    '--memory-pressure-off',
+    '--max_old_space_size=4096',
+    # Background subsystems a headless automation browser never uses
+    '--disable-background-networking',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-breakpad',
+    '--disable-client-side-phishing-detection',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-features=TranslateUI,BlinkGenPropertyTrees',
+    '--disable-hang-monitor',
+    '--disable-ipc-flooding-protection',
+    '--disable-popup-blocking',
+    '--disable-prompt-on-repost',
+    '--disable-renderer-backgrounding',
+    '--disable-sync',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--mute-audio',
+    '--window-size=1280,800',
+)
+_NO_IMAGES_CHROME_ARGS = ('--blink-settings=imagesEnabled=false',)
+_NO_IMAGES_CHROME_PREFS = {"profile.managed_default_content_settings.images": 2}
+
+# Pages that load a client-side framework render their content in the browser,
+# so a static fetch of them can't be trusted to contain the data
+_SPA_SCRIPT_RE = re.compile(rb'<script[^>]+src=["\'][^"\']*(?:react|vue|angular)', re.IGNORECASE)
+
+# Submit controls, by type first and then by a visible "Submit" label
+_SUBMIT_CSS = "input[type='submit'], button[type='submit']"
+_SUBMIT_XPATH = "//button[contains(normalize-space(.),'Submit')] | //input[@value='Submit']"
+
+# Requests blocked through the DevTools protocol; none of the tasks need them
+_BLOCKED_URL_PATTERNS = (
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.mp4", "*.webm", "*.mp3",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*"
+)
+_BLOCKED_IMAGE_PATTERNS = ("*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico")
+
+# Scrolls arguments[0] into view and clicks it, returning a cheap fingerprint
+# of the DOM (element count and text length) from before the click. When
+# arguments[1] holds the fingerprint from a previous click and the DOM no
+# longer matches it, nothing is clicked and null is returned.
+_CLICK_JS = """
+const [el, expected] = arguments;
+const fingerprint = document.getElementsByTagName('*').length + '|' + document.body.innerText.length;
+if (expected !== null && fingerprint !== expected) return null;
+el.scrollIntoView({block: 'center'});
+el.click();
+return fingerprint;
+"""
+
+# Seconds between checks in explicit waits; Selenium's 0.5 s default rounds
+# every lookup up to the next half second
+_WAIT_POLL_FREQUENCY = 0.1
+
+# Connections kept open to chromedriver, shared by every session; urllib3
+# defaults to one, which serializes commands and logs "Connection pool is full"
+# under concurrency
+_COMMAND_POOL_MAXSIZE = max(20, int(os.getenv('BROWSER_POOL_SIZE', '4')) * 4)
+
+# Sets a form control's value through the native setter, so framework-bound
+# (e.g. React) inputs see the change, and fires input/change. Returns false for
+# file inputs and non-form elements, which need real keystrokes from WebDriver.
+_SET_VALUE_FN = r"""
+const setValue = (el, value) => {
+    const cls = [HTMLInputElement, HTMLTextAreaElement, HTMLSelectElement]
+        .find((c) => el instanceof c);
+    if (!cls || el.type === 'file') return false;
+    Object.getOwnPropertyDescriptor(cls.prototype, 'value').set.call(el, String(value));
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    return true;
+};
+"""
+
+# Fills [selector, value] pairs in the page, trying the same strategies as
+# _field_locators, and returns whether each was filled
+_FILL_FIELDS_JS = _SET_VALUE_FN + r"""
+const attr = (v) => '"' + v.replace(/["\\]/g, '\\$&') + '"';
+const query = (selector) => {
+    try { return document.querySelector(selector); } catch (e) { return null; }
+};
+const locate = (key) =>
+    document.getElementsByName(key)[0] ||
+    document.getElementById(key) ||
+    query(key) ||
+    query('input[placeholder=' + attr(key) + ']') ||
+    query('input[aria-label=' + attr(key) + ']');
+return arguments[0].map(([key, value]) => {
+    const el = locate(key);
+    return el ? setValue(el, value) : false;
+});
+"""
+
+# Fills one located element (arguments[0]) with arguments[1]
+_FILL_ELEMENT_JS = _SET_VALUE_FN + "return setValue(arguments[0], arguments[1]);"
+
+# Returns, for each CSS selector, a list of {text, tag, attributes} for its
+# matches, or {error} when the selector is invalid. Attributes mirror
+# WebElement.get_attribute: the property when it is a string (so href/src are
+# absolute), otherwise the raw attribute, and only non-empty values are kept.
+_EXTRACT_DATA_JS = r"""
+const ATTRIBUTES = ['href', 'src', 'alt', 'title', 'class', 'id'];
+const describe = (el) => {
+    const attributes = {};
+    for (const name of ATTRIBUTES) {
+        let value = name === 'class' ? null : el[name];
+        if (typeof value !== 'string') value = el.getAttribute(name);
+        if (value) attributes[name] = value;
+    }
+    return {
+        text: (el.innerText || '').trim(),
+        tag: el.tagName.toLowerCase(),
+        attributes: attributes
+    };
+};
+return arguments[0].map((selector) => {
+    try {
+        return Array.from(document.querySelectorAll(selector), describe);
+    } catch (e) {
+        return {error: e.message};
+    }
+});
+"""
+
+# XPath fallbacks for form fields, filled in with an _xpath_literal
+_FIELD_XPATH_TEMPLATES = (
+    "//input[@placeholder={}]",
+    "//input[@aria-label={}]",
+    "//textarea[@name={}]",
+    "//select[@name={}]"
+)
+
+def _xpath_literal(value: str) -> str:
+    """Quote a string for XPath 1.0, which has no escape for quotes"""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = value.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
+@functools.lru_cache(maxsize=256)
+def _field_locators(field_selector: str) -> Tuple[Tuple[str, str], ...]:
+    """Locator strategies tried for a form field, built once per field name"""
+    literal = _xpath_literal(field_selector)
+    return (
+        (By.NAME, field_selector),
+        (By.ID, field_selector),
+        (By.CSS_SELECTOR, field_selector),
+        *((By.XPATH, template.format(literal)) for template in _FIELD_XPATH_TEMPLATES)
+    )
+
+@functools.lru_cache(maxsize=1)
+def _get_driver_path() -> str:
+    """Resolve the chromedriver binary once; install() checks versions on every call"""
+    return ChromeDriverManager().install()
+
+class _SharedChromeConnection(ChromiumRemoteConnection):
+    """Command connection to the long-lived chromedriver, used by every session"""
+    
+    def close(self):
+        # Called on each driver.quit(); keep the sockets for the other sessions
+        pass
+
+_driver_service: Optional[Service] = None
+_driver_connection: Optional[_SharedChromeConnection] = None
+_driver_service_lock = threading.Lock()
+
+def _get_driver_connection() -> _SharedChromeConnection:
+    """Start chromedriver once (or again if it died) and return a connection to it.
+    
+    New sessions then only cost a Chrome launch, not a chromedriver launch too.
+    Unlike webdriver.Chrome, Remote sessions don't look up the browser through
+    selenium-manager, so Chrome must be installed where chromedriver finds it
+    (its default location or PATH).
+    """
+    global _driver_service, _driver_connection
+    with _driver_service_lock:
+        if _driver_service is None or _driver_service.process.poll() is not None:
+            if _driver_service is None:
+                atexit.register(_stop_driver_service)
+            service = Service(executable_path=_get_driver_path(), port=0)
+            service.start()
+            connection = _SharedChromeConnection(
+                service.service_url, vendor_prefix="goog", browser_name="chrome", keep_alive=True
+            )
+            connection._conn.connection_pool_kw['maxsize'] = _COMMAND_POOL_MAXSIZE
+            _driver_service, _driver_connection = service, connection
+        return _driver_connection
+
+def _stop_driver_service():
+    # Quit pooled browsers while chromedriver can still end their sessions
+    if _browser_pool is not None:
+        _browser_pool.close()
+    if _driver_service is not None:
+        _driver_service.stop()
+
 class WebAutomationController:
     """Advanced web automation controller with Selenium and BeautifulSoup integration"""
     
-    def __init__(self, headless: bool = True, timeout: int = 30):
+    def __init__(self, headless: bool = True, timeout: int = 30, load_images: bool = False):
         self.headless = headless
         self.timeout = timeout
+        self.load_images = load_images
         self.driver = None
         self.wait = None
         self.session = requests.Session()
+        # Elements located on the current page, keyed by (strategy, selector)
+        self._element_cache: Dict[Tuple[str, str], WebElement] = {}
+        # DOM fingerprint taken when each cached click target was last clicked
+        self._click_fingerprints: Dict[Tuple[str, str], str] = {}
         
     def initialize_driver(self):
         """Initialize Chrome WebDriver with optimized settings"""
         chrome_options = Options()
+        chrome_options.arguments.extend(_BASE_CHROME_ARGS)
         
         if self.headless:
-            chrome_options.add_argument('--headless')
-        
-        # Optimization arguments
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--disable-extensions')
-        chrome_options.add_argument('--disable-logging')
-        chrome_options.add_argument('--silent')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+            chrome_options.add_argument('--headless=new')
         
-        # Performance settings
-        chrome_options.add_argument('--memory-pressure-off')
-        chrome_options.add_argument('--max_old_space_size=4096')
+        # Return from driver.get() at DOMContentLoaded instead of waiting for
+        # every subresource, and skip image downloads unless they are wanted
+        chrome_options.page_load_strategy = 'eager'
+        if not self.load_images:
+            chrome_options.arguments.extend(_NO_IMAGES_CHROME_ARGS)
+            chrome_options.add_experimental_option("prefs", _NO_IMAGES_CHROME_PREFS)
         
         try:
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            # chromedriver runs on this host, so file inputs take local paths
+            # as-is; Remote's default detector would upload each file's
+            # contents through the command channel first
+            self.driver = webdriver.Remote(
+                command_executor=_get_driver_connection(),
+                options=chrome_options,
+                file_detector=UselessFileDetector()
+            )
+            self._block_heavy_requests()
             self.driver.set_page_load_timeout(self.timeout)
-            self.wait = WebDriverWait(self.driver, self.timeout)
+            self.wait = WebDriverWait(
+                self.driver, self.timeout,
+                poll_frequency=_WAIT_POLL_FREQUENCY,
+                ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)
+            )
             return True
         except Exception as e:
             print(f"Failed to initialize WebDriver: {str(e)}")
+            # Don't leave a half-configured session behind; navigate_to_url
+            # only retries initialization when there is no driver
+            if self.driver:
+                try:
+                    self.driver.quit()
+                except Exception:
+                    pass
+            self.driver = self.wait = None
             return False
     
+    def _block_heavy_requests(self):
+        """Stop Chrome fetching fonts, media and trackers (and images unless wanted)"""
+        patterns = list(_BLOCKED_URL_PATTERNS)
+        if not self.load_images:
+            patterns.extend(_BLOCKED_IMAGE_PATTERNS)
+        # Remote sessions have no execute_cdp_cmd; the shared connection
+        # registers the same chromedriver command
+        self._execute_cdp("Network.enable", {})
+        self._execute_cdp("Network.setBlockedURLs", {"urls": patterns})
+    
+    def _execute_cdp(self, cmd: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self.driver.execute("executeCdpCommand", {"cmd": cmd, "params": params})["value"]
+    
     def navigate_to_url(self, url: str) -> Dict[str, Any]:
         """Navigate to a specific URL"""
         try:
@@ -61,8 +318,11 @@ class WebAutomationController:
                 if not self.initialize_driver():
                     return {'success': False, 'error': 'Failed to initialize WebDriver'}
             
+            self._forget_elements()
             self.driver.get(url)
-            time.sleep(2)  # Allow page to load
+            # Wait for the DOM to be ready rather than a fixed delay; with the
+            # eager load strategy subresources may still be loading
+            self.wait.until(lambda d: d.execute_script("return document.readyState") != "loading")
             
             return {
                 'success': True,
@@ -78,48 +338,47 @@ class WebAutomationController:
             filled_fields = []
             failed_fields = []
             
-            for field_selector, value in form_data.items():
+            # Locate and fill every field in one round-trip; only fields the
+            # script can't handle go through the slower WebDriver lookup
+            filled = self.driver.execute_script(_FILL_FIELDS_JS, list(form_data.items())) if form_data else []
+            
+            for (field_selector, value), js_filled in zip(form_data.items(), filled):
+                if js_filled:
+                    filled_fields.append(field_selector)
+                    continue
+                
                 try:
-                    # Try multiple selector strategies
-                    element = None
-                    selectors_to_try = [
-                        (By.NAME, field_selector),
-                        (By.ID, field_selector),
-                        (By.CSS_SELECTOR, field_selector),
-                        (By.XPATH, f"//input[@placeholder='{field_selector}']"),
-                        (By.XPATH, f"//input[@aria-label='{field_selector}']"),
-                        (By.XPATH, f"//textarea[@name='{field_selector}']"),
-                        (By.XPATH, f"//select[@name='{field_selector}']")
-                    ]
-                    
-                    for by_type, selector in selectors_to_try:
-                        try:
-                            element = self.wait.until(EC.presence_of_element_located((by_type, selector)))
-                            break
-                        except:
-                            continue
-                    
-                    if element:
-                        # Clear existing text and enter new value
+                    element = self._locate_field(field_selector)
+                    if not self.driver.execute_script(_FILL_ELEMENT_JS, element, value):
+                        # Clear existing text and type the value for file
+                        # inputs and content-editable elements
                         element.clear()
                         element.send_keys(value)
-                        filled_fields.append(field_selector)
-                    else:
-                        failed_fields.append(field_selector)
-                        
+                    filled_fields.append(field_selector)
+                except TimeoutException:
+                    failed_fields.append(field_selector)
                 except Exception as field_error:
                     failed_fields.append(f"{field_selector}: {str(field_error)}")
             
             # Submit form if requested
             if submit:
                 try:
-                    submit_button = self.driver.find_element(By.CSS_SELECTOR, "input[type='submit'], button[type='submit'], button:contains('Submit')")
+                    current_url = self.driver.current_url
+                    submit_button = self._locate_submit_button(current_url)
                     submit_button.click()
-                    time.sleep(3)  # Wait for submission
+                    # Wait for the submission to navigate away; forms submitted
+                    # via XHR do neither, so cap the wait at the old fixed delay
+                    try:
+                        WebDriverWait(self.driver, 3, poll_frequency=_WAIT_POLL_FREQUENCY).until(EC.any_of(
+                            EC.staleness_of(submit_button),
+                            EC.url_changes(current_url)
+                        ))
+                    except TimeoutException:
+                        pass
                 except:
                     # Try pressing Enter on the last filled field
                     if filled_fields:
-                        last_element = self.driver.find_element(By.NAME, filled_fields[-1])
+                        last_element = self._locate_field(filled_fields[-1])
                         last_element.send_keys(Keys.RETURN)
             
             return {
@@ -132,39 +391,41 @@ class WebAutomationController:
         except Exception as e:
             return {'success': False, 'error': f'Form filling failed: {str(e)}'}
     
+    def _forget_elements(self):
+        """Drop every located element, e.g. after the page may have changed"""
+        self._element_cache.clear()
+        self._click_fingerprints.clear()
+    
+    def _cached_element(self, key: Tuple[str, str]) -> Optional[WebElement]:
+        """Return a previously located element if it is still attached and enabled"""
+        element = self._element_cache.get(key)
+        if element is None:
+            return None
+        try:
+            if element.is_enabled():
+                return element
+        except StaleElementReferenceException:
+            pass
+        del self._element_cache[key]
+        return None
+    
+    def _locate_field(self, field_selector: str) -> WebElement:
+        """Wait for a form field matched by any of the supported strategies"""
+        key = ('field', field_selector)
+        element = self._cached_element(key)
+        if element is None:
+            element = self._element_cache[key] = self.wait.until(EC.any_of(
+                *(EC.presence_of_element_located(locator) for locator in _field_locators(field_selector))
+            ))
+        return element
+    
     def extract_data(self, selectors: List[str]) -> Dict[str, Any]:
         """Extract data using CSS selectors"""
         try:
-            extracted_data = {}
-            
-            for selector in selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    if elements:
-                        # Extract text, attributes, or other data
-                        element_data = []
-                        for element in elements:
-                            data = {
-                                'text': element.text.strip(),
-                                'tag': element.tag_name,
-                                'attributes': {}
-                            }
-                            
-                            # Get common attributes
-                            for attr in ['href', 'src', 'alt', 'title', 'class', 'id']:
-                                value = element.get_attribute(attr)
-                                if value:
-                                    data['attributes'][attr] = value
-                            
-                            element_data.append(data)
-                        
-                        extracted_data[selector] = element_data
-                    else:
-                        extracted_data[selector] = []
-                        
-                except Exception as selector_error:
-                    extracted_data[selector] = {'error': str(selector_error)}
+            # Collect text, tag and common attributes for every match of every
+            # selector in one round-trip instead of one per element property
+            results = self.driver.execute_script(_EXTRACT_DATA_JS, selectors) if selectors else []
+            extracted_data = dict(zip(selectors, results))
             
             return {
                 'success': True,
@@ -176,27 +437,54 @@ class WebAutomationController:
         except Exception as e:
             return {'success': False, 'error': f'Data extraction failed: {str(e)}'}
     
-    def perform_click_sequence(self, click_selectors: List[str], wait_between: float = 1.0) -> Dict[str, Any]:
-        """Perform a sequence of clicks"""
+    def _locate_submit_button(self, url: str) -> WebElement:
+        """Find the form's submit button, remembering it for repeated submissions on this page"""
+        key = ('submit', url)
+        element = self._cached_element(key)
+        if element is None:
+            buttons = (self.driver.find_elements(By.CSS_SELECTOR, _SUBMIT_CSS)
+                       or self.driver.find_elements(By.XPATH, _SUBMIT_XPATH))
+            if not buttons:
+                raise NoSuchElementException("No submit button found")
+            element = self._element_cache[key] = buttons[0]
+        return element
+    
+    def perform_click_sequence(self, click_selectors: List[str], wait_between: float = 0.0) -> Dict[str, Any]:
+        """Perform a sequence of clicks.
+        
+        Each click waits for its element to become clickable, so no delay is
+        needed between clicks; pass ``wait_between`` for pages that need one.
+        """
         try:
             successful_clicks = []
             failed_clicks = []
             
             for selector in click_selectors:
                 try:
-                    # Wait for element to be clickable
-                    element = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
-                    
-                    # Scroll element into view
-                    self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                    time.sleep(0.5)
+                    # Click the element from an earlier click on this page
+                    # directly if the DOM hasn't changed since
+                    key = (By.CSS_SELECTOR, selector)
+                    element = self._element_cache.get(key)
+                    fingerprint = None
+                    if element is not None:
+                        try:
+                            fingerprint = self.driver.execute_script(
+                                _CLICK_JS, element, self._click_fingerprints.get(key)
+                            )
+                        except StaleElementReferenceException:
+                            pass
                     
-                    # Click the element
-                    element.click()
+                    # Otherwise wait for it to be clickable, then scroll to and
+                    # click it in one script call
+                    if fingerprint is None:
+                        element = self._element_cache[key] = self.wait.until(EC.element_to_be_clickable(key))
+                        fingerprint = self.driver.execute_script(_CLICK_JS, element, None)
+                    self._click_fingerprints[key] = fingerprint
                     successful_clicks.append(selector)
                     
                     # Wait between clicks
-                    time.sleep(wait_between)
+                    if wait_between:
+                        time.sleep(wait_between)
                     
                 except Exception as click_error:
                     failed_clicks.append(f"{selector}: {str(click_error)}")
@@ -220,15 +508,29 @@ class WebAutomationController:
             uploaded_files = []
             failed_files = []
             
+            # Check every path up front with a single stat call each
+            existing_files = []
             for file_path in file_paths:
                 try:
-                    if os.path.exists(file_path):
+                    os.stat(file_path)
+                    existing_files.append(file_path)
+                except OSError:
+                    failed_files.append(f"{file_path}: File not found")
+            
+            if len(existing_files) > 1 and file_input.get_attribute('multiple'):
+                # Inputs accepting several files take them all in one call
+                try:
+                    file_input.send_keys("\n".join(existing_files))
+                    uploaded_files.extend(existing_files)
+                except Exception as upload_error:
+                    failed_files.extend(f"{file_path}: {str(upload_error)}" for file_path in existing_files)
+            else:
+                for file_path in existing_files:
+                    try:
                         file_input.send_keys(file_path)
                         uploaded_files.append(file_path)
-                    else:
-                        failed_files.append(f"{file_path}: File not found")
-                except Exception as upload_error:
-                    failed_files.append(f"{file_path}: {str(upload_error)}")
+                    except Exception as upload_error:
+                        failed_files.append(f"{file_path}: {str(upload_error)}")
             
             return {
                 'success': len(uploaded_files) > 0,
@@ -242,6 +544,8 @@ class WebAutomationController:
     def execute_javascript(self, script: str) -> Dict[str, Any]:
         """Execute custom JavaScript code"""
         try:
+            # The script may rewrite the DOM, so don't trust located elements
+            self._forget_elements()
             result = self.driver.execute_script(script)
             return {
                 'success': True,
@@ -277,6 +581,13 @@ class WebAutomationController:
             return self.driver.current_url
         return ""
     
+    def reset(self):
+        """Clear cookies and unload the current page so the browser can be reused"""
+        self._forget_elements()
+        if self.driver:
+            self.driver.delete_all_cookies()
+            self.driver.get("about:blank")
+    
     def close(self):
         """Close the WebDriver"""
         if self.driver:
@@ -287,80 +598,300 @@ class WebAutomationController:
         """Cleanup when object is destroyed"""
         self.close()
 
-# Task execution functions
-def execute_form_fill_task(task_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Execute form filling task"""
-    controller = WebAutomationController(headless=True)
+class BrowserPool:
+    """Pool of reusable controllers so tasks don't pay Chrome startup each time.
     
-    try:
-        # Navigate to URL
-        nav_result = controller.navigate_to_url(task_data['url'])
-        if not nav_result['success']:
-            return nav_result
+    Controllers are created lazily up to ``size`` and handed out by
+    ``acquire``; ``release`` resets one for the next task, or closes it once it
+    has served ``max_uses`` tasks so long-lived browsers don't accumulate state.
+    Both idle controllers and free capacity are guarded by one ``Condition``,
+    so a waiting ``acquire`` wakes when either becomes available.
+    """
+    
+    def __init__(self, size: int = 4, max_uses: int = 50, headless: bool = True, timeout: int = 30):
+        self.size = size
+        self.max_uses = max_uses
+        self.headless = headless
+        self.timeout = timeout
+        self._idle: Deque[WebAutomationController] = deque()
+        self._uses: Dict[int, int] = {}
+        self._created = 0
+        self._available = threading.Condition()
+    
+    def warm(self, count: Optional[int] = None):
+        """Start up to ``count`` browsers ahead of time (default: the pool size)"""
+        for _ in range(count or self.size):
+            with self._available:
+                if self._created >= self.size:
+                    return
+                self._created += 1
+            
+            controller = self._new_controller()
+            controller.initialize_driver()
+            with self._available:
+                self._idle.append(controller)
+                self._available.notify()
+    
+    def acquire(self) -> WebAutomationController:
+        """Get an idle controller, starting a new one if the pool has room"""
+        with self._available:
+            while True:
+                if self._idle:
+                    return self._idle.popleft()
+                if self._created < self.size:
+                    self._created += 1
+                    break
+                self._available.wait()
         
-        # Fill form
-        form_data = task_data.get('form_data', {})
-        result = controller.fill_form(form_data, submit=task_data.get('submit', False))
+        return self._new_controller()
+    
+    def release(self, controller: WebAutomationController):
+        """Return a controller to the pool, recycling it when worn out or broken"""
+        with self._available:
+            uses = self._uses.get(id(controller), 0) + 1
+            self._uses[id(controller)] = uses
         
-        return result
+        if uses < self.max_uses:
+            try:
+                controller.reset()
+            except Exception:
+                pass
+            else:
+                with self._available:
+                    self._idle.append(controller)
+                    self._available.notify()
+                return
         
-    finally:
-        controller.close()
+        self._discard(controller)
+    
+    def close(self):
+        """Close every idle controller"""
+        with self._available:
+            idle = list(self._idle)
+            self._idle.clear()
+        for controller in idle:
+            self._discard(controller)
+    
+    def _new_controller(self) -> WebAutomationController:
+        return WebAutomationController(headless=self.headless, timeout=self.timeout)
+    
+    def _discard(self, controller: WebAutomationController):
+        try:
+            controller.close()
+        except Exception:
+            pass
+        with self._available:
+            self._uses.pop(id(controller), None)
+            self._created -= 1
+            # The freed slot lets a waiting acquire start a new controller
+            self._available.notify()
 
-def execute_data_extraction_task(task_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Execute data extraction task"""
-    controller = WebAutomationController(headless=True)
+_browser_pool: Optional[BrowserPool] = None
+_browser_pool_lock = threading.Lock()
+
+def get_browser_pool() -> BrowserPool:
+    """Get the shared browser pool, sized by BROWSER_POOL_SIZE / BROWSER_MAX_USES.
     
+    Set BROWSER_POOL_WARM to start that many browsers in the background as
+    soon as the pool is created.
+    """
+    global _browser_pool
+    with _browser_pool_lock:
+        if _browser_pool is None:
+            _browser_pool = BrowserPool(
+                size=int(os.getenv('BROWSER_POOL_SIZE', '4')),
+                max_uses=int(os.getenv('BROWSER_MAX_USES', '50'))
+            )
+            atexit.register(_browser_pool.close)
+            
+            warm_count = int(os.getenv('BROWSER_POOL_WARM', '0'))
+            if warm_count > 0:
+                threading.Thread(
+                    target=_browser_pool.warm, args=(warm_count,), name="browser-pool-warm", daemon=True
+                ).start()
+        return _browser_pool
+
+_static_sessions = threading.local()
+
+def _get_static_session() -> requests.Session:
+    """Per-thread requests session for static fetches, reusing its connections"""
+    session = getattr(_static_sessions, 'session', None)
+    if session is None:
+        session = _static_sessions.session = requests.Session()
+        session.headers['User-Agent'] = _USER_AGENT
+    return session
+
+def try_static_extract(url: str, selectors: List[str], timeout: int = 30) -> Optional[Dict[str, Any]]:
+    """Extract data from the raw HTML without a browser.
+    
+    Returns None when the page needs a browser: the fetch fails, the response
+    isn't HTML, it loads a client-side framework, or nothing matches. No
+    browser-pool slot is used, so call this before borrowing a controller.
+    """
+    session = _get_static_session()
     try:
-        # Navigate to URL
-        nav_result = controller.navigate_to_url(task_data['url'])
-        if not nav_result['success']:
-            return nav_result
-        
-        # Extract data
-        selectors = task_data.get('selectors', [])
-        result = controller.extract_data(selectors)
+        response = session.get(url, timeout=timeout)
+        response.raise_for_status()
+    except requests.RequestException:
+        return None
+    finally:
+        # Each task starts without cookies, like a reset pooled browser
+        session.cookies.clear()
+    
+    if not response.headers.get('content-type', '').startswith('text/html'):
+        return None
+    if _SPA_SCRIPT_RE.search(response.content):
+        return None
+    
+    soup = BeautifulSoup(response.content, 'lxml')
+    extracted_data = {}
+    
+    for selector in selectors:
+        try:
+            elements = soup.select(selector)
+        except Exception as selector_error:
+            extracted_data[selector] = {'error': str(selector_error)}
+            continue
         
-        return result
+        element_data = []
+        for element in elements:
+            data = {
+                'text': element.get_text(' ', strip=True),
+                'tag': element.name,
+                'attributes': {}
+            }
+            
+            # Get common attributes, resolving links like the browser does
+            for attr in ['href', 'src', 'alt', 'title', 'class', 'id']:
+                value = element.get(attr)
+                if isinstance(value, list):
+                    value = ' '.join(value)
+                if value and attr in ('href', 'src'):
+                    value = urljoin(response.url, value)
+                if value:
+                    data['attributes'][attr] = value
+            
+            element_data.append(data)
         
-    finally:
-        controller.close()
+        extracted_data[selector] = element_data
+    
+    if not any(isinstance(v, list) and v for v in extracted_data.values()):
+        return None
+    
+    return {
+        'success': True,
+        'data': extracted_data,
+        'total_selectors': len(selectors),
+        'successful_extractions': len([k for k, v in extracted_data.items() if not isinstance(v, dict) or 'error' not in v])
+    }
 
-def execute_click_automation_task(task_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Execute click automation task"""
-    controller = WebAutomationController(headless=True)
+def _run_pooled(runner: Callable[[Dict[str, Any], WebAutomationController], Dict[str, Any]],
+                task_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Run ``runner`` on a controller borrowed from the shared browser pool"""
+    pool = get_browser_pool()
+    controller = pool.acquire()
     
     try:
-        # Navigate to URL
-        nav_result = controller.navigate_to_url(task_data['url'])
-        if not nav_result['success']:
-            return nav_result
-        
-        # Perform clicks
-        click_sequence = task_data.get('click_sequence', [])
-        result = controller.perform_click_sequence(click_sequence)
-        
-        return result
-        
+        return runner(task_data, controller)
     finally:
-        controller.close()
+        pool.release(controller)
+
+# Task execution functions
+def execute_form_fill_task(task_data: Dict[str, Any],
+                           controller: Optional[WebAutomationController] = None) -> Dict[str, Any]:
+    """Execute form filling task"""
+    if controller is None:
+        return _run_pooled(execute_form_fill_task, task_data)
+    
+    # Navigate to URL
+    nav_result = controller.navigate_to_url(task_data['url'])
+    if not nav_result['success']:
+        return nav_result
+    
+    # Fill form
+    form_data = task_data.get('form_data', {})
+    return controller.fill_form(form_data, submit=task_data.get('submit', False))
 
-def execute_file_upload_task(task_data: Dict[str, Any]) -> Dict[str, Any]:
+def execute_data_extraction_task(task_data: Dict[str, Any],
+                                 controller: Optional[WebAutomationController] = None) -> Dict[str, Any]:
+    """Execute data extraction task"""
+    # Static pages don't need a browser at all
+    selectors = task_data.get('selectors', [])
+    result = try_static_extract(task_data['url'], selectors)
+    if result is not None:
+        return result
+    
+    if controller is None:
+        return _run_pooled(_extract_with_browser, task_data)
+    return _extract_with_browser(task_data, controller)
+
+def _extract_with_browser(task_data: Dict[str, Any], controller: WebAutomationController) -> Dict[str, Any]:
+    # Navigate to URL
+    nav_result = controller.navigate_to_url(task_data['url'])
+    if not nav_result['success']:
+        return nav_result
+    
+    # Extract data
+    return controller.extract_data(task_data.get('selectors', []))
+
+def execute_click_automation_task(task_data: Dict[str, Any],
+                                  controller: Optional[WebAutomationController] = None) -> Dict[str, Any]:
+    """Execute click automation task"""
+    if controller is None:
+        return _run_pooled(execute_click_automation_task, task_data)
+    
+    # Navigate to URL
+    nav_result = controller.navigate_to_url(task_data['url'])
+    if not nav_result['success']:
+        return nav_result
+    
+    # Perform clicks
+    click_sequence = task_data.get('click_sequence', [])
+    return controller.perform_click_sequence(click_sequence)
+
+def execute_file_upload_task(task_data: Dict[str, Any],
+                             controller: Optional[WebAutomationController] = None) -> Dict[str, Any]:
     """Execute file upload task"""
-    controller = WebAutomationController(headless=True)
+    if controller is None:
+        return _run_pooled(execute_file_upload_task, task_data)
+    
+    # Navigate to URL
+    nav_result = controller.navigate_to_url(task_data['url'])
+    if not nav_result['success']:
+        return nav_result
     
+    # Upload files
+    file_selector = task_data.get('file_selector', 'input[type="file"]')
+    files = task_data.get('files', [])
+    return controller.upload_files(file_selector, files)
+
+_TASK_RUNNERS = {
+    'form_fill': execute_form_fill_task,
+    'data_extraction': execute_data_extraction_task,
+    'click_automation': execute_click_automation_task,
+    'file_upload': execute_file_upload_task,
+}
+
+def _execute_task(task_data: Dict[str, Any]) -> Dict[str, Any]:
+    runner = _TASK_RUNNERS.get(task_data.get('task_type'))
+    if runner is None:
+        return {'success': False, 'error': f"Unknown task type: {task_data.get('task_type')}"}
     try:
-        # Navigate to URL
-        nav_result = controller.navigate_to_url(task_data['url'])
-        if not nav_result['success']:
-            return nav_result
-        
-        # Upload files
-        file_selector = task_data.get('file_selector', 'input[type="file"]')
-        files = task_data.get('files', [])
-        result = controller.upload_files(file_selector, files)
-        
-        return result
-        
-    finally:
-        controller.close()
\ No newline at end of file
+        # Runners borrow a pooled controller only for the work that needs one
+        return runner(task_data)
+    except Exception as e:
+        return {'success': False, 'error': f'Task execution failed: {str(e)}'}
+
+def execute_tasks_batch(tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Execute tasks concurrently, one browser per worker, returning results in input order.
+    
+    Each task is dispatched on its ``task_type``; the worker count matches the
+    browser pool so every worker can hold its own session.
+    """
+    if not tasks:
+        return []
+    
+    pool = get_browser_pool()
+    with ThreadPoolExecutor(max_workers=min(pool.size, len(tasks)),
+                            thread_name_prefix="browser") as executor:
+        return list(executor.map(_execute_task, tasks))